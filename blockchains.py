@@ -17,10 +17,18 @@ __maintainer__ = 'thedzy'
 __email__ = 'thedzy@hotmail.com'
 __status__ = 'Development'
 
+import asyncio
+import collections
+import concurrent.futures
+import csv
+import functools
 import hashlib
 import json
 import os
 import pickle
+import shutil
+import sys
+import tempfile
 import time
 
 
@@ -45,6 +53,18 @@ class Blockchain(object):
             filename = 'blockchain.chain'
         self.__save_file = os.path.join(path, filename)
 
+        # Query results, the chain is append only so a result only needs the blocks added since
+        self.__cache = collections.OrderedDict()
+        self.__cache_bytes = 0
+        self.__cache_size = 64 * 1024 * 1024
+
+        # Archival, old blocks are moved to disk leaving their metadata in the chain
+        self.__archive_keep = 0
+        self.__archive_age = 0
+        self.__archive_file = None
+        self.__archive = None
+        self.__archive_offsets = []
+
     def __del__(self):
         """
         Deconstruct the class
@@ -55,6 +75,9 @@ class Blockchain(object):
         if self.__auto_save:
             self.quick_save(True)
 
+        if self.__archive is not None:
+            self.__archive.close()
+
     def append(self, value):
         """
         Append data/value to the blockchain
@@ -72,6 +95,10 @@ class Blockchain(object):
             block['block_data'] = {'value': value}
         self.__create_stub()
 
+        # Move blocks past the thresholds out of memory
+        if self.__archive_keep or self.__archive_age:
+            self.__archive_blocks()
+
         # Save the file after each append
         if self.__auto_save:
             if self.__index % self.__auto_save_freq == 0:
@@ -95,7 +122,7 @@ class Blockchain(object):
         :return: (dict) Block
         """
         if index >= 0 and index < self.__index:
-            return self.__chain[index]['block_data'].copy()
+            return self.__get_block(index)['block_data'].copy()
         else:
             return None
 
@@ -122,7 +149,7 @@ class Blockchain(object):
         :return: (bool/None) Verified/None if not found
         """
         if index >= 0 and index < self.__index:
-            hashed = self.__get_hash(self.__chain[index])
+            hashed = self.__get_hash(self.__get_block(index))
             check = self.__chain[index + 1]['block_hash']
 
             if hashed == check:
@@ -140,7 +167,7 @@ class Blockchain(object):
         """
         if index >= 0 and index < self.__index:
             block = self.__chain[index].copy()
-            del block['block_data']
+            block.pop('block_data', None)
             return block
         else:
             return None
@@ -162,7 +189,7 @@ class Blockchain(object):
         start = 0 if start < 0 else start
         end = self.__index if end > self.__index else end
 
-        return self.__parse_chain(self.__chain[start:end])
+        return self.__parse_chain(self.__iter_blocks(range(start, end)))
 
     def get_date_range(self, start, end):
         """
@@ -171,20 +198,19 @@ class Blockchain(object):
         :param end: (int) End epoch
         :return: (list) Subsection of the blockchain
         """
-        sub_chain = []
+        def match(block):
+            return block['block_epoch_time'] > start and block['block_epoch_time'] < end
 
-        for block in self.__chain[:self.__index]:
-            if block['block_epoch_time'] > start and block['block_epoch_time'] < end:
-                sub_chain.append(block.copy())
+        indexes = self.__cached_scan(('get_date_range', start, end), match, metadata=True)
 
-        return self.__parse_chain(sub_chain)
+        return self.__parse_chain(self.__iter_blocks(indexes))
 
     def get_chain(self):
         """
         Return the entire chain
         :return: (List) Blocks
         """
-        return self.__parse_chain(self.__chain[:self.__index])
+        return self.__parse_chain(self.__iter_blocks(range(self.__index)))
 
     def get_chain_length(self):
         """
@@ -201,22 +227,22 @@ class Blockchain(object):
         :param insensitive: (bool) Case insensitive
         :return: (list) Subsection of the blockchain
         """
-        sub_chain = []
-
         if isinstance(value, str):
             if insensitive:
                 value = value.lower()
 
-        for block in self.__chain[:self.__index]:
+        def match(block):
             if key in block['block_data']:
                 key_data = block['block_data'][key]
                 if isinstance(key_data, str):
                     if insensitive:
                         key_data = key_data.lower()
-                if key_data == value:
-                    sub_chain.append(block.copy())
+                return key_data == value
+            return False
 
-        return self.__parse_chain(sub_chain)
+        indexes = self.__cached_scan(('find_key_value', key, value, insensitive), match)
+
+        return self.__parse_chain(self.__iter_blocks(indexes))
 
     def find_key_value_range(self, key, lower, upper):
         """
@@ -226,23 +252,23 @@ class Blockchain(object):
         :param upper: (int) Upper range
         :return: (list) Subsection of the blockchain
         """
-        sub_chain = []
-
         lower = float(lower)
         upper = float(upper)
 
         if lower > upper:
             print('Invalid search criteria')
-            return sub_chain
+            return []
 
-        for block in self.__chain[:self.__index]:
+        def match(block):
             if key in block['block_data']:
                 key_data = block['block_data'][key]
                 if isinstance(key_data, (int, float)):
-                    if key_data >= lower and key_data <= upper:
-                        sub_chain.append(block.copy())
+                    return key_data >= lower and key_data <= upper
+            return False
 
-        return self.__parse_chain(sub_chain)
+        indexes = self.__cached_scan(('find_key_value_range', key, lower, upper), match)
+
+        return self.__parse_chain(self.__iter_blocks(indexes))
 
     def find_key_value_any(self, value, insensitive=False):
         """
@@ -257,7 +283,7 @@ class Blockchain(object):
             if insensitive:
                 value = value.lower()
 
-        for block in self.__chain[:self.__index]:
+        for block in self.__iter_blocks(range(self.__index)):
             for key in block['block_data']:
                 key_data = block['block_data'][key]
                 if isinstance(key_data, str):
@@ -268,6 +294,122 @@ class Blockchain(object):
 
         return self.__parse_chain(sub_chain)
 
+    def export_jsonl(self, file, start=None, end=None, date_start=None, date_end=None, fields=None, metadata=False):
+        """
+        Stream blocks to a JSON Lines file, one block per line
+        :param file: (string/file) Filename or file-like object
+        :param start: (int) Start index
+        :param end: (int) End index
+        :param date_start: (int) Start epoch
+        :param date_end: (int) End epoch
+        :param fields: (list) Data keys to export, all keys if not set
+        :param metadata: (bool) Include the block id, epoch time and hash
+        :return: (int) Number of blocks exported
+        """
+        def write(handle):
+            count = 0
+            for row in self.__export_rows(start, end, date_start, date_end, fields, metadata):
+                handle.write(json.dumps(row) + '\n')
+                count += 1
+            return count
+
+        return self.__export(file, write)
+
+    def export_csv(self, file, start=None, end=None, date_start=None, date_end=None, fields=None, metadata=False):
+        """
+        Stream blocks to a CSV file, one block per row
+        :param file: (string/file) Filename or file-like object
+        :param start: (int) Start index
+        :param end: (int) End index
+        :param date_start: (int) Start epoch
+        :param date_end: (int) End epoch
+        :param fields: (list) Data keys to export, all keys if not set
+        :param metadata: (bool) Include the block id, epoch time and hash
+        :return: (int) Number of blocks exported
+        """
+        def write(handle):
+            rows = functools.partial(self.__export_rows, start, end, date_start, date_end, fields, metadata)
+
+            # Without a projection, find the columns with a first pass
+            if fields is None:
+                columns = {}
+                for row in rows():
+                    columns.update(dict.fromkeys(row))
+                columns = list(columns)
+            else:
+                columns = (['block_id', 'block_epoch_time', 'block_hash'] if metadata else []) + list(fields)
+
+            writer = csv.DictWriter(handle, columns, restval='', extrasaction='ignore')
+            writer.writeheader()
+            count = 0
+            for row in rows():
+                # Keep strings and numbers as they are, anything else (dicts, lists, booleans, None) as JSON
+                for key, value in row.items():
+                    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+                        row[key] = json.dumps(value)
+                writer.writerow(row)
+                count += 1
+            return count
+
+        return self.__export(file, write)
+
+    @staticmethod
+    def __export(file, write):
+        """
+        Call a writer on a file-like object, opening and closing the file if given a filename
+        :param file: (string/file) Filename or file-like object
+        :param write: (function) Writer
+        :return: (int) Number of blocks exported
+        """
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with open(file, 'w', newline='', encoding='utf-8') as handle:
+                return write(handle)
+
+        return write(file)
+
+    def __export_rows(self, start, end, date_start, date_end, fields, metadata):
+        """
+        Iterate the blocks to export as flat rows
+        :param start: (int) Start index
+        :param end: (int) End index
+        :param date_start: (int) Start epoch
+        :param date_end: (int) End epoch
+        :param fields: (list) Data keys to export, all keys if not set
+        :param metadata: (bool) Include the block id, epoch time and hash
+        :return: (generator) Rows
+        """
+        start = 0 if start is None or start < 0 else start
+        end = self.__index if end is None or end > self.__index else end
+
+        # Filter on the metadata held in memory so only the selected blocks are read
+        indexes = range(start, end)
+        if date_start is not None or date_end is not None:
+            date_start = float('-inf') if date_start is None else date_start
+            date_end = float('inf') if date_end is None else date_end
+            indexes = (index for index in indexes
+                       if date_start < self.__chain[index]['block_epoch_time'] < date_end)
+
+        for block in self.__iter_blocks(indexes):
+            row = {}
+            if metadata:
+                block_metadata = {'block_id': block['block_id'], 'block_epoch_time': block['block_epoch_time'],
+                                  'block_hash': block['block_hash']}
+                row.update(block_metadata)
+
+            data = block['block_data']
+            if fields is None:
+                row.update(data)
+            else:
+                for field in fields:
+                    if field in data:
+                        row[field] = data[field]
+
+            # Data keys with the same name never replace the block's own metadata
+            if metadata:
+                row.update(block_metadata)
+
+            yield row
+
     def validate(self):
         """
         Validate the entire chain
@@ -281,6 +423,194 @@ class Blockchain(object):
 
         return validity
 
+    def cache_size(self, size=None):
+        """
+        Set/Get the memory limit of the query cache
+        :param size: (int) Size in bytes, 0 to disable the cache
+        :return: (int) Current state
+        """
+        if size is not None:
+            self.__cache_size = int(size)
+            self.__trim_cache()
+
+        return self.__cache_size
+
+    def clear_cache(self):
+        """
+        Empty the query cache
+        :return: (void)
+        """
+        self.__cache.clear()
+        self.__cache_bytes = 0
+
+    def __cached_scan(self, query, match, metadata=False):
+        """
+        Return the indexes of the blocks matching a query, scanning only blocks added since the last call
+        :param query: (tuple) Query name and parameters
+        :param match: (function) Test a block
+        :param metadata: (bool) Test only the metadata held in memory, without reading archived blocks
+        :return: (list) Indexes
+        """
+        try:
+            entry = self.__cache.pop(query, None)
+        except TypeError:
+            # Unhashable parameters cannot be cached
+            query = None
+            entry = None
+
+        if entry is None:
+            start, indexes, size = 0, [], 0
+        else:
+            start, indexes, size = entry
+            self.__cache_bytes -= size
+
+        scan = range(start, self.__index)
+        blocks = self.__chain[start:self.__index] if metadata else self.__iter_blocks(scan)
+        for index, block in zip(scan, blocks):
+            if match(block):
+                indexes.append(index)
+
+        if query is not None and self.__cache_size > 0:
+            # Estimate the memory held: the list, its integers and the key with its parameters
+            size = sys.getsizeof(indexes) + len(indexes) * sys.getsizeof(self.__index)
+            size += sys.getsizeof(query) + sum(sys.getsizeof(item) for item in query)
+            self.__cache[query] = (self.__index, indexes, size)
+            self.__cache_bytes += size
+            self.__trim_cache()
+
+        return indexes
+
+    def __trim_cache(self):
+        """
+        Evict the least recently used results until the cache fits in memory
+        :return: (void)
+        """
+        while self.__cache and self.__cache_bytes > self.__cache_size:
+            _, (_, _, size) = self.__cache.popitem(last=False)
+            self.__cache_bytes -= size
+
+    def archive(self, keep=None, age=None):
+        """
+        Set/Get the archival of old blocks to disk
+        :param keep: (int) Number of recent blocks to keep in memory, 0 to disable
+        :param age: (int) Seconds to keep blocks in memory, 0 to disable
+        :return: (tuple) Current state (keep, age)
+        """
+        if keep is not None:
+            self.__archive_keep = int(keep)
+        if age is not None:
+            self.__archive_age = float(age)
+
+        if self.__archive_keep or self.__archive_age:
+            self.__archive_blocks()
+
+        return self.__archive_keep, self.__archive_age
+
+    def __archive_blocks(self):
+        """
+        Move the blocks past the thresholds to the archive file
+        :return: (void)
+        """
+        keep_from = self.__index - self.__archive_keep if self.__archive_keep else 0
+        age_from = time.time() - self.__archive_age
+
+        index = len(self.__archive_offsets)
+        if index >= self.__index:
+            return
+
+        if self.__archive is None:
+            self.__archive_file, self.__archive = self.__new_archive()
+
+        while index < self.__index:
+            block = self.__chain[index]
+            by_count = index < keep_from
+            by_age = self.__archive_age and block['block_epoch_time'] < age_from
+            if not by_count and not by_age:
+                break
+
+            # Store the whole block and leave only its metadata in memory, the hash still covers the data
+            data = pickle.dumps(block)
+            self.__archive.seek(0, os.SEEK_END)
+            self.__archive_offsets.append((self.__archive.tell(), len(data)))
+            self.__archive.write(data)
+            self.__chain[index] = {key: block[key] for key in block if key != 'block_data'}
+            index += 1
+
+        self.__archive.flush()
+
+    def __new_archive(self):
+        """
+        Create an empty archive file next to the save file, never reusing an existing file
+        :return: (tuple) Filename, open file
+        """
+        filename = self.__save_file + '.archive'
+        try:
+            return filename, open(filename, 'x+b')
+        except FileExistsError:
+            # The name is taken, possibly by the archive of another saved chain
+            handle, filename = tempfile.mkstemp(prefix=os.path.basename(self.__save_file) + '.', suffix='.archive',
+                                                dir=os.path.dirname(self.__save_file) or None)
+            return filename, os.fdopen(handle, 'w+b')
+
+    def __move_archive(self):
+        """
+        Copy the archive to a new file for the current save file, the previous save keeps the old archive
+        :return: (void)
+        """
+        filename, handle = self.__new_archive()
+        try:
+            self.__archive.flush()
+            self.__archive.seek(0)
+            shutil.copyfileobj(self.__archive, handle)
+            handle.flush()
+        except Exception:
+            handle.close()
+            os.remove(filename)
+            raise
+
+        self.__archive.close()
+        self.__archive_file, self.__archive = filename, handle
+
+    def __get_block(self, index):
+        """
+        Return a full block, reading it from the archive if needed
+        :param index: (int) Index
+        :return: (dict) Block
+        """
+        if index < len(self.__archive_offsets):
+            offset, length = self.__archive_offsets[index]
+            self.__archive.seek(offset)
+            return pickle.loads(self.__archive.read(length))
+
+        return self.__chain[index]
+
+    def __iter_blocks(self, indexes):
+        """
+        Iterate full blocks, reading archived blocks in sequence
+        :param indexes: (iterable) Ascending indexes
+        :return: (generator) Blocks
+        """
+        archived = len(self.__archive_offsets)
+        for index in indexes:
+            if index < archived:
+                offset, length = self.__archive_offsets[index]
+                # Records are usually contiguous, only seek when they are not
+                if self.__archive.tell() != offset:
+                    self.__archive.seek(offset)
+                yield pickle.loads(self.__archive.read(length))
+            else:
+                yield self.__chain[index]
+
+    def __dump(self, file):
+        """
+        Write the chain and the location of its archived blocks
+        :param file: (file) Open file
+        :return: (void)
+        """
+        pickle.dump(self.__chain, file)
+        if self.__archive_offsets:
+            pickle.dump({'archive_file': self.__archive_file, 'archive_offsets': self.__archive_offsets}, file)
+
     def autosave(self, save=None):
         """
         Set/Get the autosave feature
@@ -319,10 +649,15 @@ class Blockchain(object):
             filename = 'blockchain.chain'
 
         if os.path.exists(path):
+            previous_save_file = self.__save_file
             self.__save_file = os.path.join(path, filename)
             try:
+                # A new save file gets its own archive so the two saves never share one
+                if self.__archive is not None and self.__save_file != previous_save_file:
+                    self.__move_archive()
+
                 with open(self.__save_file, 'wb') as file:
-                    pickle.dump(self.__chain, file)
+                    self.__dump(file)
                     self.autosave(True)
             except Exception as err:
                 print('Save failed, autosave disabled')
@@ -340,7 +675,7 @@ class Blockchain(object):
         if self.__save_file is not None:
             try:
                 with open(self.__save_file, 'wb') as file:
-                    pickle.dump(self.__chain, file)
+                    self.__dump(file)
             except Exception as err:
                 print('Quick save failed')
                 print(err)
@@ -371,8 +706,28 @@ class Blockchain(object):
         if os.path.exists(self.__save_file):
             try:
                 with open(self.__save_file, 'rb') as file:
-                    self.__chain = pickle.load(file)
-                    self.__index = len(self.__chain) - 1
+                    chain = pickle.load(file)
+
+                    # Reopen the archive if the chain has one
+                    try:
+                        archive = pickle.load(file)
+                    except EOFError:
+                        archive = {'archive_file': None, 'archive_offsets': []}
+
+                archive_handle = None
+                if archive['archive_offsets']:
+                    if not os.path.exists(archive['archive_file']):
+                        raise FileNotFoundError('Archive \'{}\' not found'.format(archive['archive_file']))
+                    archive_handle = open(archive['archive_file'], 'a+b')
+
+                # Only replace the current chain once everything has been read
+                previous = (self.__chain, self.__index, self.__archive, self.__archive_file, self.__archive_offsets)
+                self.__chain = chain
+                self.__index = len(self.__chain) - 1
+                self.__archive = archive_handle
+                self.__archive_file = archive['archive_file']
+                self.__archive_offsets = archive['archive_offsets']
+                self.clear_cache()
             except Exception as err:
                 print(err)
                 self.autosave(False)
@@ -382,8 +737,25 @@ class Blockchain(object):
             self.autosave(False)
             return False
 
-        if self.validate():
+        try:
+            valid = self.validate()
+        except Exception as err:
+            # The archive could not be read, go back to the previous chain
+            if self.__archive is not None:
+                self.__archive.close()
+            self.__chain, self.__index, self.__archive, self.__archive_file, self.__archive_offsets = previous
+            self.clear_cache()
+            print(err)
+            self.autosave(False)
+            return False
+
+        if previous[2] is not None:
+            previous[2].close()
+
+        if valid:
             self.autosave(True)
+            if self.__archive_keep or self.__archive_age:
+                self.__archive_blocks()
             return True
         else:
             self.autosave(False)
@@ -414,3 +786,336 @@ class Blockchain(object):
         string_dictionary = json.dumps(dictionary)
         hashed = hashlib.blake2b(bytes(string_dictionary, 'utf-8')).hexdigest()
         return hashed
+
+
+class AsyncBlockchain(object):
+    def __init__(self, path=None, filename=None, blockchain=None):
+        """
+        Initialise the class
+        :param path: (string) Path to filename
+        :param filename: (string) Filename
+        :param blockchain: (Blockchain) Existing blockchain to wrap
+        """
+        if blockchain is None:
+            blockchain = Blockchain(path, filename)
+        self.__blockchain = blockchain
+
+        # A single worker serialises access to the blockchain, the chain itself is not thread safe, created when needed
+        self.__executor = None
+        self.__closed_executor = None
+
+        # Appends are queued and committed in order by one task, created when first needed in the running loop
+        self.__queue = None
+        self.__worker = None
+
+    async def __aenter__(self):
+        """
+        Enter the context
+        :return: (AsyncBlockchain) Self
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Exit the context, finishing any queued appends
+        :return: (void)
+        """
+        await self.close()
+
+    async def close(self):
+        """
+        Wait for queued appends and stop the workers, they are started again if the blockchain is used after
+        :return: (void)
+        """
+        worker, queue = self.__worker, self.__queue
+        if worker is not None:
+            if not worker.done() and worker.get_loop() is asyncio.get_running_loop():
+                await queue.join()
+
+            # Detach the worker before cancelling it, appends made from now on start a new one
+            if self.__worker is worker:
+                self.__worker = None
+                self.__queue = None
+            worker.cancel()
+            if worker.get_loop() is asyncio.get_running_loop():
+                try:
+                    await worker
+                except asyncio.CancelledError:
+                    pass
+
+            # A worker left by another event loop can no longer run, fail what it did not commit
+            self.__fail_queue(queue)
+
+        if self.__executor is not None:
+            # Wait for calls still running on the worker thread, without blocking the loop
+            executor = self.__executor
+            self.__executor = None
+            self.__closed_executor = executor
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+            if self.__closed_executor is executor:
+                self.__closed_executor = None
+
+    async def append(self, value):
+        """
+        Append data/value to the blockchain
+        :param value: (any) Value/Dictionary
+        :return: (int) Index number
+        """
+        loop = asyncio.get_running_loop()
+        if self.__worker is None or self.__worker.done() or self.__worker.get_loop() is not loop:
+            if self.__queue is not None:
+                self.__fail_queue(self.__queue)
+            self.__queue = asyncio.Queue()
+            self.__worker = loop.create_task(self.__append_worker(self.__queue))
+
+        future = loop.create_future()
+        await self.__queue.put((value, future))
+        return await future
+
+    async def __append_worker(self, queue):
+        """
+        Commit queued appends one at a time
+        :param queue: (asyncio.Queue) Queue of values and futures
+        :return: (void)
+        """
+        while True:
+            value, future = await queue.get()
+            try:
+                block_id = await self.__run(self.__blockchain.append, value)
+            except Exception as err:
+                if not future.cancelled():
+                    future.set_exception(err)
+            else:
+                if not future.cancelled():
+                    future.set_result(block_id)
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    def __fail_queue(queue):
+        """
+        Fail the appends left in a queue that no worker will read
+        :param queue: (asyncio.Queue) Queue of values and futures
+        :return: (void)
+        """
+        while not queue.empty():
+            _, future = queue.get_nowait()
+            queue.task_done()
+            if not future.done():
+                try:
+                    future.set_exception(RuntimeError('Append worker stopped before the value was appended'))
+                except RuntimeError:
+                    # The loop waiting on it is already closed
+                    pass
+
+    async def get_index(self, index):
+        """
+        Return the data at the current index
+        :param index:
+        :return: (dict) Block
+        """
+        return await self.__run(self.__blockchain.get_index, index)
+
+    async def get_verified_index(self, index):
+        """
+        Return the block if verified
+        :param index: (int) Index
+        :return: (dict/None) Dictionary/None if not found
+        """
+        return await self.__run(self.__blockchain.get_verified_index, index)
+
+    async def verify_index(self, index):
+        """
+        Verify a block by index
+        :param index: (int) index
+        :return: (bool/None) Verified/None if not found
+        """
+        return await self.__run(self.__blockchain.verify_index, index)
+
+    async def get_index_metadata(self, index):
+        """
+        Return the metadata of the block
+        :param index:
+        :return: (dict) Block
+        """
+        return await self.__run(self.__blockchain.get_index_metadata, index)
+
+    async def get_indexes(self, start, end):
+        """
+        Return a range of indexes
+        :param start: (int) Start index
+        :param end: (int) End index
+        :return: (list) Subsection of the blockchain
+        """
+        return await self.__run(self.__blockchain.get_indexes, start, end)
+
+    async def get_date_range(self, start, end):
+        """
+        Return a range by dates
+        :param start: (int) Start epoch
+        :param end: (int) End epoch
+        :return: (list) Subsection of the blockchain
+        """
+        return await self.__run(self.__blockchain.get_date_range, start, end)
+
+    async def get_chain(self):
+        """
+        Return the entire chain
+        :return: (List) Blocks
+        """
+        return await self.__run(self.__blockchain.get_chain)
+
+    async def get_chain_length(self):
+        """
+        Return the chain length
+        :return: (int) Length
+        """
+        return self.__blockchain.get_chain_length()
+
+    async def find_key_value(self, key, value, insensitive=False):
+        """
+        Find a block by a key and value
+        :param key: (string) Key name
+        :param value: (any) value
+        :param insensitive: (bool) Case insensitive
+        :return: (list) Subsection of the blockchain
+        """
+        return await self.__run(self.__blockchain.find_key_value, key, value, insensitive)
+
+    async def find_key_value_range(self, key, lower, upper):
+        """
+        Find a block by a key and value
+        :param key: (string) Key name
+        :param lower: (int) Lower range
+        :param upper: (int) Upper range
+        :return: (list) Subsection of the blockchain
+        """
+        return await self.__run(self.__blockchain.find_key_value_range, key, lower, upper)
+
+    async def find_key_value_any(self, value, insensitive=False):
+        """
+        Find a block by a key and value
+        :param value: (any) Search value
+        :param insensitive: (bool) Case insensitive
+        :return: (list) Subsection of the blockchain
+        """
+        return await self.__run(self.__blockchain.find_key_value_any, value, insensitive)
+
+    async def export_jsonl(self, file, start=None, end=None, date_start=None, date_end=None, fields=None, metadata=False):
+        """
+        Stream blocks to a JSON Lines file, one block per line
+        :param file: (string/file) Filename or file-like object
+        :param start: (int) Start index
+        :param end: (int) End index
+        :param date_start: (int) Start epoch
+        :param date_end: (int) End epoch
+        :param fields: (list) Data keys to export, all keys if not set
+        :param metadata: (bool) Include the block id, epoch time and hash
+        :return: (int) Number of blocks exported
+        """
+        return await self.__run(self.__blockchain.export_jsonl, file, start, end, date_start, date_end, fields, metadata)
+
+    async def export_csv(self, file, start=None, end=None, date_start=None, date_end=None, fields=None, metadata=False):
+        """
+        Stream blocks to a CSV file, one block per row
+        :param file: (string/file) Filename or file-like object
+        :param start: (int) Start index
+        :param end: (int) End index
+        :param date_start: (int) Start epoch
+        :param date_end: (int) End epoch
+        :param fields: (list) Data keys to export, all keys if not set
+        :param metadata: (bool) Include the block id, epoch time and hash
+        :return: (int) Number of blocks exported
+        """
+        return await self.__run(self.__blockchain.export_csv, file, start, end, date_start, date_end, fields, metadata)
+
+    async def validate(self):
+        """
+        Validate the entire chain
+        :return: (bool) Verified
+        """
+        return await self.__run(self.__blockchain.validate)
+
+    async def cache_size(self, size=None):
+        """
+        Set/Get the memory limit of the query cache
+        :param size: (int) Size in bytes, 0 to disable the cache
+        :return: (int) Current state
+        """
+        return await self.__run(self.__blockchain.cache_size, size)
+
+    async def clear_cache(self):
+        """
+        Empty the query cache
+        :return: (void)
+        """
+        return await self.__run(self.__blockchain.clear_cache)
+
+    async def archive(self, keep=None, age=None):
+        """
+        Set/Get the archival of old blocks to disk
+        :param keep: (int) Number of recent blocks to keep in memory, 0 to disable
+        :param age: (int) Seconds to keep blocks in memory, 0 to disable
+        :return: (tuple) Current state (keep, age)
+        """
+        return await self.__run(self.__blockchain.archive, keep, age)
+
+    async def autosave(self, save=None):
+        """
+        Set/Get the autosave feature
+        :param save: (bool) Enable/Disable the autosave
+        :return: (bool) Current state
+        """
+        return await self.__run(self.__blockchain.autosave, save)
+
+    async def autosave_freq(self, freq=None):
+        """
+        Set/Get the autosave frequency
+        :param freq: (int) 1/nth records
+        :return: (int) Current state
+        """
+        return await self.__run(self.__blockchain.autosave_freq, freq)
+
+    async def save(self, path=None, filename=None):
+        """
+        Save the blockchain
+        :param path: (string) Path to filename
+        :param filename: (string) Filename
+        :return: (void)
+        """
+        return await self.__run(self.__blockchain.save, path, filename)
+
+    async def quick_save(self, report=False):
+        """
+        Call a save using the last known file
+        :param report:
+        :return:
+        """
+        return await self.__run(self.__blockchain.quick_save, report)
+
+    async def load(self, path=None, filename=None):
+        """
+        Load the blockchain
+        :param path: (string) Path to filename
+        :param filename: (string) Filename
+        :return: (bool) File loaded
+        """
+        return await self.__run(self.__blockchain.load, path, filename)
+
+    async def __run(self, function, *args):
+        """
+        Run a blocking call on the worker thread
+        :param function: (function) Blockchain method
+        :param args: (any) Arguments
+        :return: (any) Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        if self.__executor is None:
+            # Never let a new worker thread run alongside one that is still being closed
+            if self.__closed_executor is not None:
+                await loop.run_in_executor(None, self.__closed_executor.shutdown)
+                self.__closed_executor = None
+            if self.__executor is None:
+                self.__executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        return await loop.run_in_executor(self.__executor, functools.partial(function, *args))